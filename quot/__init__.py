@@ -2,30 +2,75 @@
 """
 __init__.py
 
+The public functions are loaded lazily, so that importing
+quot does not pull in the numeric stack (or Qt) until one
+of them is actually used.
+
 """
-# Enforce PySide6 backend to pyqtgraph
-import PySide6
-import pyqtgraph
-
-# Core functions to run localization and tracking on single files
-# or directories
-from .core import (
-    localize_file,
-    track_file,
-    track_directory,
-    retrack_file,
-    retrack_files
-)
-
-# Read and filter image files
-from .read import ImageReader, read_config
-from .chunkFilter import ChunkFilter
-
-# Find spots
-from .findSpots import detect
-
-# Localize spots to subpixel resolution
-from .subpixel import localize, localize_frame
-
-# Reconnection spots into trajectories
-from .track import track
+import sys
+import types
+import importlib
+
+# Map of public name -> (submodule, attribute)
+_LAZY_ATTRS = {
+
+    # Core functions to run localization and tracking on single files
+    # or directories
+    "localize_file": (".core", "localize_file"),
+    "track_file": (".core", "track_file"),
+    "track_directory": (".core", "track_directory"),
+    "retrack_file": (".core", "retrack_file"),
+    "retrack_files": (".core", "retrack_files"),
+
+    # Read and filter image files
+    "ImageReader": (".read", "ImageReader"),
+    "read_config": (".read", "read_config"),
+    "ChunkFilter": (".chunkFilter", "ChunkFilter"),
+
+    # Find spots
+    "detect": (".findSpots", "detect"),
+
+    # Localize spots to subpixel resolution
+    "localize": (".subpixel", "localize"),
+    "localize_frame": (".subpixel", "localize_frame"),
+
+    # Reconnection spots into trajectories
+    "track": (".track", "track"),
+}
+
+__all__ = list(_LAZY_ATTRS.keys())
+
+def __getattr__(name):
+    """
+    Import the submodule that defines *name* on first access
+    and cache the result in the module namespace.
+
+    """
+    try:
+        submodule, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError("module {} has no attribute {}".format(
+            __name__, name)) from None
+    value = getattr(importlib.import_module(submodule, __name__), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
+
+class _QuotModule(types.ModuleType):
+    """
+    Module class for the quot package. Importing the quot.track
+    submodule (directly, or through another submodule like
+    quot.core) makes the import system bind it to the name 
+    "track" in this namespace, which would shadow the track()
+    function. Ignore that binding, so that quot.track keeps 
+    resolving to the function through __getattr__.
+
+    """
+    def __setattr__(self, name, value):
+        if name == "track" and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _QuotModule
@@ -2,11 +2,18 @@
 __init__.py
 
 """
-import PySide6
+import os
+
+# Enforce PySide6 backend to pyqtgraph. This must be set before
+# pyqtgraph is first imported.
+os.environ.setdefault('PYQTGRAPH_QT_LIB', 'PySide6')
+try:
+    import PySide6
+except ImportError as e:
+    raise ImportError("the quot GUI requires PySide6") from e
 import pyqtgraph
 
 # Suppress annoying pointer dispatch warning
-import os
 os.environ['QT_LOGGING_RULES'] = 'qt.pointer.dispatch=false'
 
 from .masker import reconstruct_mask
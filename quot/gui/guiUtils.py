@@ -124,7 +124,7 @@ def coerce_type(arg, type_):
 ## FILE CONVERTERS ## 
 #####################
 
-def split_channels_nd2(nd2_path, out_dir=None):
+def split_channels_nd2(nd2_path, out_dir=None, return_arrays=True):
     """
     Split all of the channels in an ND2 image into separate TIF files.
 
@@ -134,11 +134,16 @@ def split_channels_nd2(nd2_path, out_dir=None):
         out_dir         :   str, path to a directory in which to save 
                             the output TIF files. If *None*, defaults to
                             the same directory as the input.
+        return_arrays   :   bool, keep and return the channel arrays.
+                            If *False*, each channel is released as 
+                            soon as it is written, so that only one
+                            channel is held in memory at a time.
 
     returns
     -------
         list of 3D ndarray with shape (n_frames, n_pixels_y, n_pixels_x),
-            the various channels of the image
+            the various channels of the image, or *None* if 
+            *return_arrays* is *False*
 
     """
     # Check user input
@@ -190,12 +195,16 @@ def split_channels_nd2(nd2_path, out_dir=None):
             imstack
         )
 
-        refs.append(imstack)
+        if return_arrays:
+            refs.append(imstack)
+
+        # Release this channel before allocating the next one
+        del imstack 
 
     # Close file reader
     reader.close()
 
-    return refs 
+    return refs if return_arrays else None 
 
 #############
 ## WIDGETS ##
@@ -8,11 +8,16 @@ import sys
 
 # File paths
 import os 
-from glob import glob 
+import stat
+import time
+from functools import lru_cache
+
+# Concurrent file conversion
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Main GUI utilities
 import PySide6
-from PySide6.QtCore import Qt 
+from PySide6.QtCore import Qt, QObject, QThread, Signal
 from PySide6.QtWidgets import QApplication, QWidget, QLabel, \
     QPushButton, QVBoxLayout
 
@@ -32,6 +37,191 @@ from .trackViewer import TrackViewer
 from .masker import Masker 
 from .maskInterpolator import MaskInterpolator
 
+class _StatCache(object):
+    """
+    Cache of os.path.isfile results, keyed by absolute path, so
+    that a handler checking the same path more than once only
+    stats it once (slow on network filesystems). Meant to live 
+    for a single user action, since entries are never 
+    revalidated.
+
+    """
+    def __init__(self):
+        # abs path -> bool
+        self._is_file = {}
+
+    def is_file(self, path):
+        """
+        Cached equivalent of os.path.isfile.
+
+        """
+        path = os.path.abspath(path)
+        if path not in self._is_file:
+            self._is_file[path] = os.path.isfile(path)
+        return self._is_file[path]
+
+def _scan_nd2(dirname):
+    """
+    List the ND2 files in a directory with a single os.scandir
+    call.
+
+    args
+    ----
+        dirname         :   str, path to a directory
+
+    returns
+    -------
+        tuple of str, paths to the ND2 files
+
+    """
+    # Skip hidden files (e.g. macOS "._*.nd2" sidecars), which
+    # glob("*.nd2") never matched
+    with os.scandir(dirname) as it:
+        return tuple(entry.path for entry in it \
+            if entry.name.endswith(".nd2") and not entry.name.startswith(".") \
+            and entry.is_file())
+
+@lru_cache(maxsize=32)
+def _list_nd2(dirname, dir_mtime_ns):
+    """
+    Memoized _scan_nd2, keyed on the directory's modification
+    time so that any write to the directory (including the TIFs
+    produced by split_channels_nd2) invalidates the entry.
+
+    args
+    ----
+        dirname         :   str, absolute path to a directory
+        dir_mtime_ns    :   int, modification time of *dirname*
+                            in nanoseconds; only used as part of
+                            the cache key
+
+    returns
+    -------
+        tuple of str, paths to the ND2 files
+
+    """
+    return _scan_nd2(dirname)
+
+# Directories modified more recently than this are always relisted,
+# since filesystems with coarse timestamps (exFAT: 2 s) or attribute
+# caching (NFS, SMB) may not change the mtime for a write made within
+# the same tick
+_MTIME_SLACK_NS = 2 * 10**9
+
+def _find_nd2(dirname, dir_mtime_ns):
+    """
+    List the ND2 files in a directory, reusing the memoized 
+    listing from _list_nd2 unless the directory was modified 
+    in the last couple of seconds.
+
+    args
+    ----
+        dirname         :   str, absolute path to a directory
+        dir_mtime_ns    :   int, modification time of *dirname*
+                            in nanoseconds
+
+    returns
+    -------
+        tuple of str, paths to the ND2 files
+
+    """
+    if time.time_ns() - dir_mtime_ns < _MTIME_SLACK_NS:
+        return _scan_nd2(dirname)
+    return _list_nd2(dirname, dir_mtime_ns)
+
+def _find_sibling_image(csv_path, stat_cache):
+    """
+    Look for the image file that a *_tracks.csv file was made
+    from, which is expected to sit in the same directory with
+    the same stem and an .nd2 or .tif extension.
+
+    args
+    ----
+        csv_path        :   str, path to a *_tracks.csv file
+        stat_cache      :   _StatCache, used to check for the
+                            candidate image files
+
+    returns
+    -------
+        str, path to the ND2 (preferred) or TIF file, or None
+            if *csv_path* is not a *_tracks.csv file or no
+            matching image file exists
+
+    """
+    suffix = "_tracks.csv"
+    if not csv_path.endswith(suffix):
+        return None 
+    stem = csv_path[:-len(suffix)]
+    for ext in (".nd2", ".tif"):
+        if stat_cache.is_file(stem + ext):
+            return stem + ext 
+    return None 
+
+# Maximum number of ND2 files to split at the same time. Beyond
+# this, concurrent reads tend to saturate the disk.
+SPLIT_CHANNELS_MAX_WORKERS = 4
+
+def _split_channels_nd2(nd2_path):
+    """
+    Split the channels of one ND2 file next to the original,
+    without keeping the channel arrays, so that each worker only
+    holds one channel in memory at a time.
+
+    """
+    split_channels_nd2(nd2_path, out_dir=None, return_arrays=False)
+
+class SplitChannelsWorker(QObject):
+    """
+    Split the channels of several ND2 files concurrently with a
+    small thread pool. Meant to be moved to a QThread so that
+    the GUI stays responsive while the files are converted.
+
+    init
+    ----
+        nd2_paths       :   list of str, paths to ND2 files
+        max_workers     :   int, maximum number of files to 
+                            split at once
+
+    signals
+    -------
+        file_finished   :   str, emitted with the path to each
+                            ND2 file as it finishes
+        file_failed     :   (str, str), emitted with the path to
+                            an ND2 file and the error message if 
+                            splitting it fails
+        finished        :   emitted once all files are done
+
+    """
+    file_finished = Signal(str)
+    file_failed = Signal(str, str)
+    finished = Signal()
+
+    def __init__(self, nd2_paths, max_workers=SPLIT_CHANNELS_MAX_WORKERS):
+        super(SplitChannelsWorker, self).__init__()
+        self.nd2_paths = list(nd2_paths)
+        self.max_workers = max_workers
+
+    def run(self):
+        """
+        Split all files, emitting file_finished / file_failed in
+        order of completion.
+
+        """
+        n_workers = min(self.max_workers, len(self.nd2_paths))
+        if n_workers > 0:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(_split_channels_nd2, p): p \
+                    for p in self.nd2_paths}
+                for future in as_completed(futures):
+                    nd2_path = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        self.file_failed.emit(nd2_path, str(e))
+                    else:
+                        self.file_finished.emit(nd2_path)
+        self.finished.emit()
+
 class Launcher(QWidget):
     """
     Simple GUI that presents the user with a list of options
@@ -54,6 +244,10 @@ class Launcher(QWidget):
             currdir = os.getcwd()
         self.currdir = currdir
 
+        # Background thread for splitting directories of ND2 files
+        self.split_thread = None 
+        self.split_worker = None 
+
         self.initUI()
 
     def initUI(self):
@@ -80,11 +274,14 @@ class Launcher(QWidget):
             ("Mask interpolator", self.launch_mask_interpolator),
             ("Split channels", self.split_channels)
         ]
-        self.buttons = []
+        align = Qt.AlignTop 
+        buttons = []
         for i, (label, callback) in enumerate(button_ids):
-            self.buttons.append(QPushButton(label, parent=self))
-            L.addWidget(self.buttons[-1], i+1, alignment=Qt.AlignTop)
-            self.buttons[-1].clicked.connect(callback)
+            btn = QPushButton(label, parent=self)
+            L.addWidget(btn, i+1, alignment=align)
+            btn.clicked.connect(callback)
+            buttons.append(btn)
+        self.buttons = buttons 
 
         # Show the window
         self.show()
@@ -126,26 +323,21 @@ class Launcher(QWidget):
         Launch an instance of SpotViewer on a sample file.
 
         """
+        stat_cache = _StatCache()
+
         # Prompt the user to enter a set of localizations
         path = getOpenFilePath(self, "Select locs CSV",
             "CSV files (*.csv)", initialdir=self.currdir)
 
         # Check that this is a real file path
-        if not os.path.isfile(path):
+        if not stat_cache.is_file(path):
             print("path %s does not exist" % path)
             return 
         else:
             self.currdir = os.path.dirname(path)
 
         # Try to find the corresponding image file
-        image_file = None 
-        if "_tracks.csv" in path:
-            nd2_file = path.replace("_tracks.csv", ".nd2")
-            tif_file = path.replace("_tracks.csv", ".tif")
-            if os.path.isfile(nd2_file):
-                image_file = nd2_file
-            elif os.path.isfile(tif_file):
-                image_file = tif_file
+        image_file = _find_sibling_image(path, stat_cache)
 
         # Otherwise prompt the user to enter the corresponding
         # image file
@@ -156,7 +348,7 @@ class Launcher(QWidget):
             print("Found matching image file %s" % image_file)
 
         # Check that this path exists
-        if not os.path.isfile(image_file):
+        if not stat_cache.is_file(image_file):
             print("path %s does not exist" % image_file)
             return 
 
@@ -169,26 +361,21 @@ class Launcher(QWidget):
         corresponding to one file.
 
         """
+        stat_cache = _StatCache()
+
         # Prompt the user to enter a set of localizations
         path = getOpenFilePath(self, "Select locs CSV",
             "CSV files (*.csv)", initialdir=self.currdir)
 
         # Check that this is a real file path
-        if not os.path.isfile(path):
+        if not stat_cache.is_file(path):
             print("path %s does not exist" % path)
             return 
         else:
             self.currdir = os.path.dirname(path)
 
         # Try to find the corresponding image file
-        image_file = None 
-        if "_tracks.csv" in path:
-            nd2_file = path.replace("_tracks.csv", ".nd2")
-            tif_file = path.replace("_tracks.csv", ".tif")
-            if os.path.isfile(nd2_file):
-                image_file = nd2_file
-            elif os.path.isfile(tif_file):
-                image_file = tif_file
+        image_file = _find_sibling_image(path, stat_cache)
 
         # Otherwise prompt the user to enter the corresponding
         # image file
@@ -199,7 +386,7 @@ class Launcher(QWidget):
             print("Found matching image file %s" % image_file)
 
         # Check that this path exists
-        if not os.path.isfile(image_file):
+        if not stat_cache.is_file(image_file):
             print("path %s does not exist" % image_file)
             return 
 
@@ -282,27 +469,109 @@ class Launcher(QWidget):
 
         elif ex.return_val == "Directory with ND2 files":
 
+            # Only run one directory split at a time
+            if (self.split_thread is not None) and self.split_thread.isRunning():
+                print("Already splitting channels for a directory")
+                return 
+
             # Prompt the user to enter a directory
             dirname = getOpenDirectory(self, "Select directory with ND2 files", 
                 initialdir=self.currdir)
 
-            # Get all ND2 files in this directory
-            nd2_paths = glob(os.path.join(dirname, "*.nd2"))
+            # Check that this is a real directory
+            try:
+                dir_stat = os.stat(dirname)
+            except OSError:
+                dir_stat = None 
+            if (dir_stat is None) or not stat.S_ISDIR(dir_stat.st_mode):
+                print("directory %s does not exist" % dirname)
+                return 
+
+            # Get all ND2 files in this directory. The listing is
+            # reused only while the directory is unchanged; since
+            # splitting writes the channel TIFs into this same 
+            # directory, selecting it again after a split relists it.
+            dirname = os.path.abspath(dirname)
+            nd2_paths = _find_nd2(dirname, dir_stat.st_mtime_ns)
+
+            # Split all ND2 files concurrently in a background thread
+            self.split_thread = QThread(self)
+            self.split_worker = SplitChannelsWorker(nd2_paths)
+            self.split_worker.moveToThread(self.split_thread)
+            self.split_thread.started.connect(self.split_worker.run)
+            self.split_worker.file_finished.connect(self.split_channels_file_finished)
+            self.split_worker.file_failed.connect(self.split_channels_file_failed)
+            self.split_worker.finished.connect(self.split_thread.quit,
+                Qt.DirectConnection)
+            self.split_thread.finished.connect(self.split_worker.deleteLater)
+            self.split_thread.finished.connect(self.split_thread.deleteLater)
+            self.split_thread.finished.connect(self.split_thread_finished)
+            self.split_thread.start()
+
+    def split_thread_finished(self):
+        """
+        Drop references to a directory split once its thread 
+        has finished.
+
+        """
+        if (self.split_thread is not None) and not self.split_thread.isRunning():
+            self.split_thread = None 
+            self.split_worker = None 
+
+    def split_channels_file_finished(self, nd2_path):
+        """
+        Report completion of one file from a directory split.
+
+        """
+        print("Successfully split channels for file {}".format(nd2_path))
+
+    def split_channels_file_failed(self, nd2_path, message):
+        """
+        Report failure of one file from a directory split.
 
-            # Split all ND2 files
-            for nd2_path in nd2_paths:
-                split_channels_nd2(nd2_path, out_dir=None)
-                print("Successfully split channels for file {}".format(nd2_path))
+        """
+        print("Failed to split channels for file {}: {}".format(nd2_path, message))
+
+    def closeEvent(self, event):
+        """
+        Wait for any directory split still running before closing,
+        so that its TIF files are not left half-written.
+
+        """
+        if (self.split_thread is not None) and self.split_thread.isRunning():
+            print("Waiting for channel splitting to finish...")
+            self.split_thread.wait()
+        event.accept()
+
+# Reference to the Launcher created by init_launcher(), to keep
+# it from being garbage collected
+_launcher = None 
 
 def init_launcher():
     """
     Initialize a standalone instance of Launcher.
 
+    If a QApplication already exists (for instance in Jupyter
+    or in a script that made its own), the Launcher is attached
+    to it and the caller remains responsible for its event loop.
+    Otherwise a new QApplication is created, its event loop is 
+    run and the interpreter exits when it finishes.
+
+    returns
+    -------
+        Launcher
+
     """
-    app = QApplication()
-    set_dark_app(app)
-    ex = Launcher()
-    sys.exit(app.exec_())
+    global _launcher
+    app = QApplication.instance()
+    created = app is None 
+    if created:
+        app = QApplication(sys.argv)
+        set_dark_app(app)
+    _launcher = Launcher()
+    if created:
+        sys.exit(app.exec())
+    return _launcher 
 
 if __name__ == '__main__':
     init_launcher()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""
+test_init.py -- test the lazy exports of the quot package
+
+"""
+import sys
+import subprocess
+import unittest
+
+class TestLazyImports(unittest.TestCase):
+    """
+    Test that importing quot does not pull in heavy dependencies,
+    and that the lazily-loaded exports resolve correctly.
+
+    """
+    def test_import_is_lightweight(self):
+        """
+        Importing quot alone should not import numpy or PySide6.
+
+        """
+        print("\nTESTING THAT IMPORTING QUOT DOES NOT IMPORT HEAVY DEPENDENCIES")
+        code = "import sys, quot; print(' '.join(m for m in ('numpy', 'PySide6') " \
+            "if m in sys.modules))"
+        out = subprocess.check_output([sys.executable, "-c", code])
+        assert out.decode().strip() == "", out
+
+    def test_track_is_function(self):
+        """
+        quot.track should be the track() function, even after the
+        quot.track submodule has been imported.
+
+        """
+        print("\nTESTING THAT quot.track RESOLVES TO THE track FUNCTION")
+        import quot
+        quot.track_file
+        from quot.track import track
+        assert callable(quot.track)
+        assert quot.track is track
+        from quot import track as track_
+        assert track_ is track
+
+if __name__ == '__main__':
+    unittest.main()
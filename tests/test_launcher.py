@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+test_launcher.py -- test the file listing helpers in 
+quot.gui.launcher
+
+"""
+import os
+import time
+import tempfile
+import unittest
+
+# Test targets
+from quot.gui.launcher import _scan_nd2, _list_nd2, _find_nd2
+
+def touch(path):
+    """
+    Create an empty file at *path*.
+
+    """
+    open(path, "w").close()
+
+class TestListND2(unittest.TestCase):
+    """
+    Test the ND2 directory listing used by Launcher.split_channels.
+
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dirname = self.tmpdir.name
+        _list_nd2.cache_clear()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def set_old_mtime(self):
+        """
+        Set the directory's modification time an hour in the past
+        and return it in nanoseconds.
+
+        """
+        mtime_ns = time.time_ns() - 3600 * 10**9
+        os.utime(self.dirname, ns=(mtime_ns, mtime_ns))
+        return os.stat(self.dirname).st_mtime_ns
+
+    def test_scan_filters(self):
+        """
+        Only regular, non-hidden *.nd2 files should be listed.
+
+        """
+        print("\nTESTING THE ND2 DIRECTORY LISTING")
+        touch(os.path.join(self.dirname, "a.nd2"))
+        touch(os.path.join(self.dirname, "._a.nd2"))
+        touch(os.path.join(self.dirname, "a_channel_0.tif"))
+        os.mkdir(os.path.join(self.dirname, "b.nd2"))
+        result = _scan_nd2(self.dirname)
+        assert result == (os.path.join(self.dirname, "a.nd2"),), result
+
+    def test_memoized_when_unchanged(self):
+        """
+        An unchanged, not recently modified directory should be
+        served from the cache.
+
+        """
+        print("\nTESTING MEMOIZATION OF THE ND2 DIRECTORY LISTING")
+        touch(os.path.join(self.dirname, "a.nd2"))
+        mtime_ns = self.set_old_mtime()
+        first = _find_nd2(self.dirname, mtime_ns)
+        assert len(first) == 1
+
+        # Add a file but restore the old mtime; the cached listing
+        # should be returned
+        touch(os.path.join(self.dirname, "b.nd2"))
+        os.utime(self.dirname, ns=(mtime_ns, mtime_ns))
+        assert _find_nd2(self.dirname, mtime_ns) is first
+
+        # A new mtime should relist
+        mtime_ns -= 10**9
+        os.utime(self.dirname, ns=(mtime_ns, mtime_ns))
+        assert len(_find_nd2(self.dirname, mtime_ns)) == 2
+
+    def test_recent_mtime_not_memoized(self):
+        """
+        A recently modified directory should always be relisted,
+        even if its mtime did not change.
+
+        """
+        print("\nTESTING THAT RECENTLY MODIFIED DIRECTORIES ARE RELISTED")
+        touch(os.path.join(self.dirname, "a.nd2"))
+        mtime_ns = time.time_ns()
+        assert len(_find_nd2(self.dirname, mtime_ns)) == 1
+        touch(os.path.join(self.dirname, "b.nd2"))
+        assert len(_find_nd2(self.dirname, mtime_ns)) == 2
+        assert _list_nd2.cache_info().currsize == 0
+
+if __name__ == '__main__':
+    unittest.main()